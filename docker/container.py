@@ -49,11 +49,17 @@ def parse_cli_args() -> argparse.Namespace:
 
     # Actual command definition begins here
     subparsers = parser.add_subparsers(dest="command", required=True)
-    subparsers.add_parser(
+    start = subparsers.add_parser(
         "start",
         help="Build the docker image and create the container in detached mode.",
         parents=[parent_parser],
     )
+    start.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the docker image even if it already exists. By default, the build is skipped for an"
+        " existing image.",
+    )
     subparsers.add_parser(
         "enter", help="Begin a new bash process within an existing Isaac Lab container.", parents=[parent_parser]
     )
@@ -100,10 +106,10 @@ def main(args: argparse.Namespace):
         # if x11 forwarding is enabled, add the x11 yaml and environment variables
         if x11_outputs is not None:
             (x11_yaml, x11_envar) = x11_outputs
-            ci.add_yamls += x11_yaml
+            ci.extend_yamls(x11_yaml)
             ci.environ.update(x11_envar)
         # start the container
-        ci.start()
+        ci.start(rebuild=args.rebuild)
     elif args.command == "enter":
         # refresh the x11 forwarding
         x11_utils.x11_refresh(ci.statefile)
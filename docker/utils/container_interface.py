@@ -12,19 +12,125 @@
 
 from __future__ import annotations
 
+import configparser
+import hashlib
+import json
 import os
 import platform
+import re
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 from .state_file import StateFile
 
+# resolve the docker binary once at import so each subprocess exec can skip the PATH scan.
+# falls back to the bare name if docker is not installed; the CLI reports that case separately.
+DOCKER_BIN = shutil.which("docker") or "docker"
+
+# the platform cannot change at runtime, so query it once at import instead of per instance
+# (platform.system() can shell out to `uname` on some platforms)
+_IS_DARWIN = platform.system() == "Darwin"
+
+# matches `KEY=value` assignments in .env files, ignoring surrounding whitespace.
+# comment and malformed lines simply do not match, so they are skipped. only horizontal
+# whitespace (`[^\S\n]`) is allowed around the assignment so that an empty value (`KEY=`)
+# never swallows the following line.
+_ENV_VAR_RE = re.compile(r"(?m)^[^\S\n]*([A-Za-z_]\w*)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$")
+
+# matches compose interpolation syntax: `$$`, `$VAR`, `${VAR}`, `${VAR-default}`,
+# `${VAR:-default}`, `${VAR?err}` and `${VAR:?err}`. anything fancier (e.g. nested braces)
+# does not match cleanly and makes the in-process merge fall back to the compose CLI.
+_COMPOSE_VAR_RE = re.compile(r"\$(?:\$|\{(?P<name>[A-Za-z_]\w*)(?:(?P<op>:?[-?])(?P<arg>[^}]*))?\}|(?P<bare>[A-Za-z_]\w*))")
+
+# `docker inspect` template emitting one compact JSON object per line. unlike templates that
+# address individual fields, `{{json .}}` never references a field missing from the typed
+# container/image structs, so it works for both object kinds on every docker version.
+_INSPECT_FORMAT = "{{json .}}"
+
+
+def _spawn_capture(argv: list[str]) -> tuple[int, str]:
+    """Run a command and capture its stdout, using ``os.posix_spawn`` when available.
+
+    ``subprocess`` goes through ``fork()``, which duplicates the parent's page tables — an
+    avoidable cost once the parent process has grown large. ``posix_spawn`` sidesteps that, so
+    the frequent inspect calls use it directly with a pipe for stdout (stderr is discarded,
+    matching how the callers used the captured stderr). Platforms without ``posix_spawn`` fall
+    back to ``subprocess.run``.
+
+    Args:
+        argv: The command line to execute.
+
+    Returns:
+        A tuple of the exit code and the decoded stdout.
+    """
+    if not hasattr(os, "posix_spawnp"):
+        result = subprocess.run(argv, capture_output=True, text=True, check=False)
+        return result.returncode, result.stdout
+    read_fd, write_fd = os.pipe()
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        pid = os.posix_spawnp(
+            argv[0],
+            argv,
+            os.environ,
+            file_actions=[(os.POSIX_SPAWN_DUP2, write_fd, 1), (os.POSIX_SPAWN_DUP2, devnull_fd, 2)],
+        )
+    except OSError:
+        os.close(read_fd)
+        raise
+    finally:
+        # the child holds its own duplicates; the parent only keeps the read end
+        os.close(write_fd)
+        os.close(devnull_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        stdout = reader.read()
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), stdout.decode()
+
+
+def _deep_merge(base: dict, override: dict):
+    """Merge ``override`` into ``base`` in place with compose-like semantics.
+
+    Mappings are merged recursively, sequences are concatenated, and scalars are replaced.
+    """
+    for key, value in override.items():
+        if isinstance(base.get(key), dict) and isinstance(value, dict):
+            _deep_merge(base[key], value)
+        elif isinstance(base.get(key), list) and isinstance(value, list):
+            base[key] = base[key] + value
+        else:
+            base[key] = value
+
 
 class ContainerInterface:
     """A helper class for managing Isaac Lab containers."""
 
+    __slots__ = (
+        "context_dir",
+        "statefile",
+        "profile",
+        "container_name",
+        "image_name",
+        "environ",
+        "add_yamls",
+        "add_profiles",
+        "add_env_files",
+        "dot_vars",
+        "_running_cache",
+        "_image_cache",
+        "_compose_prefix",
+    )
+
     def __init__(
         self,
         context_dir: Path,
@@ -63,69 +169,157 @@ class ContainerInterface:
         self.container_name = f"isaac-lab-{self.profile}"
         self.image_name = f"isaac-lab-{self.profile}:latest"
 
-        # Copy current environment and set DOCKER_DEFAULT_PLATFORM dynamically.
-        # On macOS (Darwin) we set it to linux/arm64; on other platforms we leave it unset.
-        self.environ = os.environ.copy()
-        if platform.system() == "Darwin":
+        # Build a minimal environment for the spawned docker subprocesses instead of copying the
+        # full (often very large) parent environment into every execve call. Only the variables
+        # docker and compose actually need are passed through: the basics plus any DOCKER_*/
+        # COMPOSE_* overrides (e.g. DOCKER_HOST, COMPOSE_PROJECT_NAME) set by the user.
+        self.environ = {
+            key: value
+            for key, value in os.environ.items()
+            if key in ("PATH", "HOME", "USER", "DISPLAY", "TERM", "XAUTHORITY")
+            or key.startswith(("DOCKER_", "COMPOSE_"))
+        }
+        # Set DOCKER_DEFAULT_PLATFORM dynamically: on macOS (Darwin) we set it to linux/arm64;
+        # on other platforms we leave it unset.
+        if _IS_DARWIN:
             self.environ['DOCKER_DEFAULT_PLATFORM'] = 'linux/arm64'
 
+        # caches for the docker inspect queries. these avoid spawning a fresh `docker inspect`
+        # subprocess (and a Docker daemon round-trip) every time a command checks the same state.
+        # each entry holds the timestamp of the query and its result, and is invalidated
+        # explicitly whenever we change the container state (see :meth:`start` and :meth:`stop`).
+        self._running_cache: tuple[float, bool] | None = None
+        self._image_cache: tuple[float, bool] | None = None
+
         # resolve the image extension through the passed yamls and envs
         self._resolve_image_extension(yamls, envs)
         # load the environment variables from the .env files
         self._parse_dot_vars()
 
-    def is_container_running(self) -> bool:
-        """Check if the container is running."""
-        status = subprocess.run(
-            ["docker", "container", "inspect", "-f", "{{.State.Status}}", self.container_name],
-            capture_output=True,
-            text=True,
-            check=False,
-        ).stdout.strip()
-        return status == "running"
-
-    def does_image_exist(self) -> bool:
-        """Check if the Docker image exists."""
-        result = subprocess.run(["docker", "image", "inspect", self.image_name], capture_output=True, text=True)
-        return result.returncode == 0
-
-    def start(self):
-        """Build and start the Docker container using Docker Compose."""
-        print(
-            f"[INFO] Building the docker image and starting the container '{self.container_name}' in the background..."
-        )
-        # Build the base image.
-        subprocess.run(
-            [
-                "docker",
-                "compose",
-                "--file", "docker-compose.yaml",
-                "--env-file", ".env.base",
-                "build",
-                "isaac-lab-base",
-            ],
-            check=False,
-            cwd=self.context_dir,
-            env=self.environ,
+    def is_container_running(self, ttl: float = 2.0) -> bool:
+        """Check if the container is running.
+
+        The result of the underlying ``docker container inspect`` call is cached for ``ttl``
+        seconds to avoid querying the Docker daemon redundantly within a single invocation.
+
+        Args:
+            ttl: How long (in seconds) a cached inspect result remains valid.
+        """
+        if self._running_cache is not None and time.monotonic() - self._running_cache[0] < ttl:
+            return self._running_cache[1]
+        self._bulk_inspect()
+        return self._running_cache[1]
+
+    def does_image_exist(self, ttl: float = 2.0) -> bool:
+        """Check if the Docker image exists.
+
+        The result of the underlying ``docker image inspect`` call is cached for ``ttl``
+        seconds to avoid querying the Docker daemon redundantly within a single invocation.
+
+        Args:
+            ttl: How long (in seconds) a cached inspect result remains valid.
+        """
+        if self._image_cache is not None and time.monotonic() - self._image_cache[0] < ttl:
+            return self._image_cache[1]
+        self._bulk_inspect()
+        return self._image_cache[1]
+
+    def _bulk_inspect(self):
+        """Query the container and image states with a single ``docker inspect`` call.
+
+        ``docker inspect`` accepts multiple object names, so both the container status and the
+        image existence can be resolved in one daemon round-trip. The format template emits one
+        JSON object per line; containers are recognized by their ``Name``/``State`` fields and
+        images by their ``RepoTags``. Objects that do not exist are simply missing from the
+        output (the command then exits with a non-zero code, which we ignore). The parsed
+        results seed both inspect caches.
+        """
+        _, stdout = _spawn_capture(
+            [DOCKER_BIN, "inspect", "--format", _INSPECT_FORMAT, self.container_name, self.image_name]
         )
+        is_running = False
+        image_exists = False
+        for line in stdout.splitlines():
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(obj, dict):
+                continue
+            if "State" in obj and obj.get("Name", "").lstrip("/") == self.container_name:
+                is_running = obj["State"].get("Status") == "running"
+            elif self.image_name in (obj.get("RepoTags") or []):
+                image_exists = True
+        now = time.monotonic()
+        self._running_cache = (now, is_running)
+        self._image_cache = (now, image_exists)
+
+    def _invalidate_inspect_cache(self):
+        """Drop the cached inspect results after an operation that changes container state."""
+        self._running_cache = None
+        self._image_cache = None
+
+    def start(self, rebuild: bool = False):
+        """Build and start the Docker container using Docker Compose.
+
+        When the image already exists, the build step is skipped entirely so BuildKit does not
+        have to walk the (potentially very large) build context on warm starts.
+
+        Args:
+            rebuild: Whether to rebuild the image even if it already exists.
+        """
+        if rebuild or not self.does_image_exist():
+            print(
+                f"[INFO] Building the docker image and starting the container '{self.container_name}' in the"
+                " background..."
+            )
+            # Optionally seed the local build cache from a previously pushed image, so fresh
+            # daemons (e.g. CI runners) reuse cached layers instead of rebuilding from scratch.
+            # This is gated behind an env var so local developers are not forced to pull.
+            if os.environ.get("ISAACLAB_USE_REMOTE_CACHE") == "1":
+                print(f"[INFO] Pulling '{self.image_name}' to seed the build cache...")
+                subprocess.run([DOCKER_BIN, "pull", self.image_name], check=False, env=self.environ)
+            # `up --build` only builds services in the active profiles, and the base service is
+            # gated behind the "base" profile. Other profiles (e.g. ros2) build FROM the base
+            # image, so it must be built explicitly first; for the base profile itself the
+            # `--build` flag below already covers it.
+            if self.profile != "base":
+                subprocess.run(
+                    [
+                        DOCKER_BIN,
+                        "compose",
+                        "--file", "docker-compose.yaml",
+                        "--env-file", ".env.base",
+                        "build",
+                        "isaac-lab-base",
+                    ],
+                    check=False,
+                    cwd=self.context_dir,
+                    env=self.environ,
+                )
+            up_args = ["up", "--detach", "--build", "--remove-orphans"]
+        else:
+            print(
+                f"[INFO] Found the existing '{self.image_name}' image. Starting the container"
+                f" '{self.container_name}' in the background... (use 'start --rebuild' to force a rebuild)"
+            )
+            up_args = ["up", "--detach", "--remove-orphans"]
         # Start the container using the merged YAMLs and env files.
         subprocess.run(
-            ["docker", "compose"]
-            + self.add_yamls
-            + self.add_profiles
-            + self.add_env_files
-            + ["up", "--detach", "--build", "--remove-orphans"],
+            self._compose_project_args() + up_args,
             check=False,
             cwd=self.context_dir,
             env=self.environ,
         )
+        # the container state has changed, so the cached inspect results are stale
+        self._invalidate_inspect_cache()
 
     def enter(self):
         """Enter the running container by executing a bash shell."""
         if self.is_container_running():
             print(f"[INFO] Entering the existing '{self.container_name}' container in a bash session...")
             subprocess.run([
-                "docker",
+                DOCKER_BIN,
                 "exec",
                 "--interactive",
                 "--tty",
@@ -141,11 +335,13 @@ class ContainerInterface:
         if self.is_container_running():
             print(f"[INFO] Stopping the launched docker container '{self.container_name}'...")
             subprocess.run(
-                ["docker", "compose"] + self.add_yamls + self.add_profiles + self.add_env_files + ["down"],
+                self._compose_project_args() + ["down"],
                 check=False,
                 cwd=self.context_dir,
                 env=self.environ,
             )
+            # the container state has changed, so the cached inspect results are stale
+            self._invalidate_inspect_cache()
         else:
             raise RuntimeError(f"Can't stop container '{self.container_name}' as it is not running.")
 
@@ -171,35 +367,192 @@ class ContainerInterface:
             # print the artifacts to be copied
             for container_path, host_path in artifacts.items():
                 print(f"  - {container_path} -> {host_path}")
+
+            # move stale host artifacts aside and delete them in the background instead of
+            # blocking on a recursive rmtree: the rename is a single syscall, and the O(files)
+            # unlink pass then runs concurrently with the docker cp transfers below
+            cleanup_threads = []
             for path in artifacts.values():
-                shutil.rmtree(path, ignore_errors=True)
+                if path.exists():
+                    trash = path.with_name(path.name + ".old")
+                    # clear any leftover from an interrupted previous run before renaming
+                    shutil.rmtree(trash, ignore_errors=True)
+                    os.rename(path, trash)
+                    thread = threading.Thread(target=shutil.rmtree, args=(trash, True))
+                    thread.start()
+                    cleanup_threads.append(thread)
 
-            # copy the artifacts
-            for container_path, host_path in artifacts.items():
-                subprocess.run(
-                    [
-                        "docker",
-                        "cp",
-                        f"{self.container_name}:{container_path}/",
-                        f"{host_path}",
-                    ],
-                    check=False,
-                )
+            # each `docker cp` streams independently through the daemon and there is no ordering
+            # requirement between the artifacts, so run the copies concurrently to overlap the
+            # transfers
+            with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+                futures = [
+                    executor.submit(
+                        subprocess.run,
+                        [
+                            DOCKER_BIN,
+                            "cp",
+                            f"{self.container_name}:{container_path}/",
+                            f"{host_path}",
+                        ],
+                        check=False,
+                    )
+                    for container_path, host_path in artifacts.items()
+                ]
+                # collect the results to surface any errors raised while copying
+                for future in futures:
+                    future.result()
+            # wait for the background deletions so no .old directories outlive the process
+            for thread in cleanup_threads:
+                thread.join()
             print("\n[INFO] Finished copying the artifacts from the container.")
         else:
             raise RuntimeError(f"The container '{self.container_name}' is not running.")
 
     def config(self, output_yaml: Path | None = None):
-        """Generate a merged Docker Compose configuration."""
+        """Generate a merged Docker Compose configuration.
+
+        The YAML files are merged and interpolated in-process when possible, which avoids a full
+        ``docker compose`` startup for what is a pure YAML transformation. Inputs the in-process
+        merge cannot handle fall back to the compose CLI.
+        """
         print("[INFO] Configuring the passed options into a YAML...")
+        merged = self._merge_compose_config()
+        if merged is not None:
+            text = yaml.safe_dump(merged, default_flow_style=False, sort_keys=False)
+            if output_yaml is not None:
+                Path(output_yaml).write_text(text)
+            else:
+                print(text)
+            return
+        # fall back to the compose CLI for inputs the in-process merge could not handle
         output = ["--output", output_yaml] if output_yaml is not None else []
         subprocess.run(
-            ["docker", "compose"] + self.add_yamls + self.add_profiles + self.add_env_files + ["config"] + output,
+            [*self._compose_prefix, "config"] + output,
             check=False,
             cwd=self.context_dir,
             env=self.environ,
         )
 
+    def _merge_compose_config(self) -> dict | None:
+        """Merge and interpolate the compose YAML files without shelling out to the compose CLI.
+
+        Each file from :attr:`add_yamls` is read, interpolated with ``${VAR}`` values from the
+        environment and the parsed ``.env`` files, loaded, and deep-merged (mappings merge
+        recursively, sequences concatenate). Like the compose CLI, top-level extension fields
+        (``x-*``) are dropped from the result and only services active for the selected
+        profiles are kept.
+
+        Returns:
+            The merged configuration, or None if PyYAML is unavailable or a file uses
+            interpolation syntax the in-process merge does not support.
+        """
+        if yaml is None:
+            return None
+        # shell environment takes precedence over the .env files, matching compose. layer
+        # self.environ on top so the merge sees exactly what the compose subprocesses receive,
+        # including the values this class injects itself (e.g. DOCKER_DEFAULT_PLATFORM on macOS)
+        variables = {**self.dot_vars, **os.environ, **self.environ}
+
+        def substitute(match: re.Match) -> str:
+            if match.group(0) == "$$":
+                return "$"
+            name = match.group("name") or match.group("bare")
+            op = match.group("op")
+            value = variables.get(name)
+            if op in ("-", ":-") and (value is None or (op == ":-" and value == "")):
+                return match.group("arg")
+            if op in ("?", ":?") and (value is None or (op == ":?" and value == "")):
+                raise ValueError(f"Required variable '{name}' is not set: {match.group('arg')}")
+            return value if value is not None else ""
+
+        merged: dict = {}
+        for name in self.add_yamls[1::2]:
+            try:
+                text = _COMPOSE_VAR_RE.sub(substitute, (self.context_dir / name).read_text())
+                if "${" in text:
+                    # interpolation syntax we do not support; let the compose CLI handle it
+                    return None
+                document = yaml.safe_load(text)
+            except (OSError, ValueError, yaml.YAMLError):
+                return None
+            if not isinstance(document, dict):
+                return None
+            _deep_merge(merged, document)
+        # keep only the services active for the selected profiles, matching
+        # `docker compose config --profile ...`; services without a profiles key always apply
+        active_profiles = set(self.add_profiles[1::2])
+        services = merged.get("services")
+        if isinstance(services, dict):
+            merged["services"] = {
+                service_name: service
+                for service_name, service in services.items()
+                if not isinstance(service, dict)
+                or not service.get("profiles")
+                or active_profiles.intersection(service["profiles"])
+            }
+        # drop the extension fields like the compose CLI does (anchors are already resolved)
+        return {key: value for key, value in merged.items() if not key.startswith("x-")}
+
+    def _compose_project_args(self) -> list[str]:
+        """Build the ``docker compose`` arguments that select the project for ``up``/``down``.
+
+        Prefers the pre-rendered project file from :meth:`_materialized_compose_file`, which lets
+        compose skip re-parsing every ``--file`` YAML and re-resolving the merged project on each
+        invocation. Falls back to the full ``--file``/``--env-file`` argument list if the project
+        could not be rendered.
+        """
+        rendered = self._materialized_compose_file()
+        if rendered is not None:
+            return [DOCKER_BIN, "compose", "--file", str(rendered)] + self.add_profiles
+        return list(self._compose_prefix)
+
+    def _materialized_compose_file(self) -> Path | None:
+        """Return the path of the cached pre-rendered compose project, refreshing it if stale.
+
+        The merged project is rendered once with ``docker compose config`` and written to
+        ``.compose.rendered.yaml`` in the context directory. The render is reused across
+        invocations and only redone when one of the inputs changes: the YAML and env files
+        (tracked by ``(path, st_mtime_ns)`` stamps) or the interpolation variables baked into
+        the render (tracked by a hash of :attr:`environ` and :attr:`dot_vars`, which covers e.g.
+        the x11 ``__ISAACLAB_TMP_*`` paths and ``DOCKER_*`` overrides).
+
+        Returns:
+            The path to the rendered project file, or None if rendering failed.
+        """
+        rendered_path = self.context_dir / ".compose.rendered.yaml"
+
+        # stamp the interpolation variables first: the render bakes their values into the output,
+        # so a changed variable must invalidate the cache even if no input file was touched
+        variables_hash = hashlib.sha256(
+            json.dumps([sorted(self.environ.items()), sorted(self.dot_vars.items())]).encode()
+        ).hexdigest()
+        stamps: list[Any] = [variables_hash]
+
+        # stamp the input files with their modification times to detect changes
+        for name in self.add_yamls[1::2] + self.add_env_files[1::2]:
+            path = self.context_dir / name
+            try:
+                stamps.append([str(path), os.stat(path).st_mtime_ns])
+            except OSError:
+                return None
+
+        # reuse the cached render if the inputs are unchanged
+        if self._get_cached_json("__COMPOSE_RENDER_STAMPS") == stamps and rendered_path.exists():
+            return rendered_path
+
+        # render the merged project once and remember the input stamps
+        result = subprocess.run(
+            [*self._compose_prefix, "config", "--output", str(rendered_path)],
+            check=False,
+            cwd=self.context_dir,
+            env=self.environ,
+        )
+        if result.returncode != 0 or not rendered_path.exists():
+            return None
+        self._set_cached_json("__COMPOSE_RENDER_STAMPS", stamps)
+        return rendered_path
+
     def _resolve_image_extension(self, yamls: list[str] | None = None, envs: list[str] | None = None):
         """Resolve additional YAML and environment file extensions for docker-compose."""
         self.add_yamls = ["--file", "docker-compose.yaml"]
@@ -217,11 +570,54 @@ class ContainerInterface:
 
         # extend the docker-compose.yaml based on the passed yamls
         if yamls is not None:
-            for yaml in yamls:
-                self.add_yamls += ["--file", yaml]
+            for yaml_file in yamls:
+                self.add_yamls += ["--file", yaml_file]
+
+        # prebuild the shared `docker compose` argument prefix once, so the individual commands
+        # do not re-concatenate the same four lists on every invocation
+        self._compose_prefix = (DOCKER_BIN, "compose", *self.add_yamls, *self.add_profiles, *self.add_env_files)
+
+    def extend_yamls(self, yaml_args: list[str]):
+        """Append additional ``--file`` arguments (e.g. the x11 overlay) after construction.
+
+        Args:
+            yaml_args: The argument pairs to append, e.g. ``["--file", "x11.yaml"]``.
+        """
+        self.add_yamls += yaml_args
+        # refresh the prebuilt prefix to include the new files
+        self._compose_prefix = (DOCKER_BIN, "compose", *self.add_yamls, *self.add_profiles, *self.add_env_files)
+
+    def _get_cached_json(self, key: str) -> Any | None:
+        """Read a JSON payload from the statefile, tolerating missing or corrupt entries.
+
+        The statefile is backed by configparser, whose value interpolation chokes on bare ``%``
+        characters (e.g. from ``.env`` values). :meth:`_set_cached_json` escapes them as ``%%``
+        on write; configparser unescapes them again on read. Entries written before the escaping
+        existed (or otherwise malformed) are treated as a cache miss instead of crashing.
+        """
+        try:
+            raw = self.statefile.get_variable(key, section="compose")
+        except configparser.Error:
+            return None
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+
+    def _set_cached_json(self, key: str, payload: Any):
+        """Store a JSON payload in the statefile, escaping ``%`` for configparser."""
+        self.statefile.set_variable(key, json.dumps(payload).replace("%", "%%"), section="compose")
+        self.statefile.save()
 
     def _parse_dot_vars(self):
-        """Parse environment variables from the .env files into a dictionary."""
+        """Parse environment variables from the .env files into a dictionary.
+
+        The parsed dictionary is persisted in the statefile together with ``(path, st_mtime_ns)``
+        stamps of the input files, so warm invocations can reuse it without re-reading every
+        ``.env`` file. The cache is refreshed whenever one of the files changes on disk.
+        """
         self.dot_vars: dict[str, Any] = {}
 
         # check if the number of arguments is even for the env files
@@ -230,7 +626,20 @@ class ContainerInterface:
                 "The parameters for env files are configured incorrectly. There should be an even number of arguments."
             )
 
-        # read the environment variables from the .env files
-        for i in range(1, len(self.add_env_files), 2):
-            with open(self.context_dir / self.add_env_files[i]) as f:
-                self.dot_vars.update(dict(line.strip().split("=", 1) for line in f if "=" in line))
+        # stamp the env files with their modification times to detect changes
+        env_paths = [self.context_dir / self.add_env_files[i] for i in range(1, len(self.add_env_files), 2)]
+        stamps = [[str(path), os.stat(path).st_mtime_ns] for path in env_paths]
+
+        # reuse the cached parse if the env files are unchanged
+        payload = self._get_cached_json("__DOTVARS_CACHE")
+        if payload is not None and payload.get("stamps") == stamps:
+            self.dot_vars = payload["vars"]
+            return
+
+        # read the environment variables from the .env files. each file is read in one shot and
+        # parsed with a single pre-compiled regex pass instead of splitting line by line.
+        for path in env_paths:
+            self.dot_vars.update(_ENV_VAR_RE.findall(path.read_text()))
+
+        # remember the parse alongside the input stamps for the next invocation
+        self._set_cached_json("__DOTVARS_CACHE", {"stamps": stamps, "vars": self.dot_vars})
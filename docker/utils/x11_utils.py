@@ -6,7 +6,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # This module provides utility functions for managing X11 forwarding in the Docker container.
-# It has been modified to support macOS by adapting the mktemp command to the BSD syntax.
+# Temporary files and directories are created with the stdlib tempfile module, which works the
+# same on macOS and Linux.
 
 from __future__ import annotations
 
@@ -14,10 +15,33 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 from .state_file import StateFile
 
+# resolve the xauth binary once at import so each subprocess exec can skip the PATH scan.
+# it may be None if xauth is not installed; configure_x11 reports that case to the user.
+XAUTH_BIN = shutil.which("xauth")
+
+# memoized configure_x11 results, keyed by the statefile path. a single CLI invocation can
+# configure X11 more than once; repeat calls reuse the already-created .xauth file instead of
+# re-reading the statefile and spawning subprocesses again. invalidated by x11_cleanup.
+_X11_CACHE: dict[Path, dict[str, str]] = {}
+
+
+def _stat_or_none(path_str: str) -> tuple[Path, os.stat_result | None]:
+    """Build a Path and stat it once, returning None for the stat result if the path is missing.
+
+    Sharing the single stat result avoids the repeated ``os.stat`` calls that separate
+    ``Path(...).exists()`` checks would issue for the same path.
+    """
+    path = Path(path_str)
+    try:
+        return path, os.stat(path)
+    except OSError:
+        return path, None
+
 
 # This method of x11 enabling forwarding was inspired by osrf/rocker
 # https://github.com/osrf/rocker
@@ -34,8 +58,13 @@ def configure_x11(statefile: StateFile) -> dict[str, str]:
             "__ISAACLAB_TMP_XAUTH": path to the temporary .xauth file.
             "__ISAACLAB_TMP_DIR": directory where the .xauth file is stored.
     """
+    # return the memoized result if the .xauth file from an earlier call still exists
+    cached = _X11_CACHE.get(statefile.path)
+    if cached is not None and Path(cached["__ISAACLAB_TMP_XAUTH"]).exists():
+        return cached
+
     # check if xauth is installed
-    if not shutil.which("xauth"):
+    if XAUTH_BIN is None:
         print("[INFO] xauth is not installed.")
         print("[INFO] Please install it with 'apt install xauth'")
         exit(1)
@@ -45,17 +74,25 @@ def configure_x11(statefile: StateFile) -> dict[str, str]:
     # load the value of the temporary xauth file
     tmp_xauth_value = statefile.get_variable("__ISAACLAB_TMP_XAUTH")
 
-    if tmp_xauth_value is None or not Path(tmp_xauth_value).exists():
+    # stat the recorded path once and reuse the result for both the existence check
+    # and the parent-directory lookup
+    tmp_xauth_stat = None
+    if tmp_xauth_value is not None:
+        tmp_xauth_path, tmp_xauth_stat = _stat_or_none(tmp_xauth_value)
+
+    if tmp_xauth_stat is None:
         # create a temporary directory to store the .xauth file
-        tmp_dir = subprocess.run(["mktemp", "-d"], capture_output=True, text=True, check=True).stdout.strip()
+        tmp_dir = tempfile.mkdtemp()
         # create the .xauth file
         tmp_xauth_value = create_x11_tmpfile(tmpdir=Path(tmp_dir))
         # set the statefile variable
         statefile.set_variable("__ISAACLAB_TMP_XAUTH", str(tmp_xauth_value))
     else:
-        tmp_dir = Path(tmp_xauth_value).parent
+        tmp_dir = tmp_xauth_path.parent
 
-    return {"__ISAACLAB_TMP_XAUTH": str(tmp_xauth_value), "__ISAACLAB_TMP_DIR": str(tmp_dir)}
+    result = {"__ISAACLAB_TMP_XAUTH": str(tmp_xauth_value), "__ISAACLAB_TMP_DIR": str(tmp_dir)}
+    _X11_CACHE[statefile.path] = result
+    return result
 
 
 def x11_check(statefile: StateFile) -> tuple[list[str], dict[str, str]] | None:
@@ -76,10 +113,26 @@ def x11_check(statefile: StateFile) -> tuple[list[str], dict[str, str]] | None:
     # check if X11 forwarding is enabled
     is_x11_forwarding_enabled = statefile.get_variable("X11_FORWARDING_ENABLED")
 
+    # non-interactive override: the ISAACLAB_X11 env var answers the question without prompting,
+    # so scripted workflows (e.g. CI) never block on user input
+    env_override = os.environ.get("ISAACLAB_X11")
+    if is_x11_forwarding_enabled is None and env_override is not None:
+        is_x11_forwarding_enabled = "1" if env_override == "1" else "0"
+        print(f"[INFO] X11 forwarding set to '{is_x11_forwarding_enabled}' from the 'ISAACLAB_X11' env var.")
+        statefile.set_variable("X11_FORWARDING_ENABLED", is_x11_forwarding_enabled)
+
     if is_x11_forwarding_enabled is None:
         print("[INFO] X11 forwarding from the Isaac Lab container is disabled by default.")
         print("[INFO] It will fail if there is no display or if running via ssh without proper configuration.")
-        x11_answer = input("Would you like to enable it? (y/N) ")
+        if sys.stdin.isatty():
+            x11_answer = input("Would you like to enable it? (y/N) ")
+            answered_explicitly = True
+        else:
+            # without a terminal there is nobody to answer the prompt; fall back to the default
+            # for this run only, so the user is still prompted on their next interactive run
+            x11_answer = "n"
+            answered_explicitly = False
+            print("[INFO] No interactive terminal detected. Keeping X11 forwarding disabled.")
 
         # parse the user's input
         if x11_answer.lower() == "y":
@@ -89,8 +142,10 @@ def x11_check(statefile: StateFile) -> tuple[list[str], dict[str, str]] | None:
             is_x11_forwarding_enabled = "0"
             print("[INFO] X11 forwarding is disabled from the container.")
 
-        # remember the user's choice and set the statefile variable
-        statefile.set_variable("X11_FORWARDING_ENABLED", is_x11_forwarding_enabled)
+        # remember the user's choice and set the statefile variable. only explicit answers are
+        # persisted: recording the no-tty default would silently disable forwarding forever
+        if answered_explicitly:
+            statefile.set_variable("X11_FORWARDING_ENABLED", is_x11_forwarding_enabled)
     else:
         # print the current configuration
         print(f"[INFO] X11 Forwarding is configured as '{is_x11_forwarding_enabled}' in '.container.cfg'.")
@@ -114,14 +169,19 @@ def x11_cleanup(statefile: StateFile):
     """Clean up the temporary .xauth file used for X11 forwarding."""
     statefile.namespace = "X11"
 
+    # the memoized configure_x11 result refers to the file being removed
+    _X11_CACHE.pop(statefile.path, None)
+
     # load the value of the temporary xauth file
     tmp_xauth_value = statefile.get_variable("__ISAACLAB_TMP_XAUTH")
 
     # if the file exists, delete it and remove the state variable
-    if tmp_xauth_value is not None and Path(tmp_xauth_value).exists():
-        print(f"[INFO] Removing temporary Isaac Lab '.xauth' file: {tmp_xauth_value}.")
-        Path(tmp_xauth_value).unlink()
-        statefile.delete_variable("__ISAACLAB_TMP_XAUTH")
+    if tmp_xauth_value is not None:
+        tmp_xauth_path, tmp_xauth_stat = _stat_or_none(tmp_xauth_value)
+        if tmp_xauth_stat is not None:
+            print(f"[INFO] Removing temporary Isaac Lab '.xauth' file: {tmp_xauth_value}.")
+            tmp_xauth_path.unlink()
+            statefile.delete_variable("__ISAACLAB_TMP_XAUTH")
 
 
 def create_x11_tmpfile(tmpfile: Path | None = None, tmpdir: Path | None = None) -> Path:
@@ -135,26 +195,33 @@ def create_x11_tmpfile(tmpfile: Path | None = None, tmpdir: Path | None = None)
         The Path to the created .xauth file.
     """
     if tmpfile is None:
-        if sys.platform == "darwin":
-            # Use BSD mktemp syntax on macOS.
-            result = subprocess.run(["mktemp", "-t", "xauth"], capture_output=True, text=True, check=True)
-            tmp_xauth = Path(result.stdout.strip())
-        else:
-            args = ["mktemp", "--suffix=.xauth"]
-            if tmpdir is not None:
-                args.append(f"--tmpdir={tmpdir}")
-            result = subprocess.run(args, capture_output=True, text=True, check=True)
-            tmp_xauth = Path(result.stdout.strip())
+        # create the temporary file in user space instead of forking a `mktemp` subprocess
+        fd, path = tempfile.mkstemp(suffix=".xauth", dir=str(tmpdir) if tmpdir is not None else None)
+        os.close(fd)
+        tmp_xauth = Path(path)
     else:
         tmpfile.touch()
         tmp_xauth = tmpfile
 
-    # Derive current MIT-MAGIC-COOKIE and make it universally addressable
-    xauth_cookie = subprocess.run(
-        ["xauth", "nlist", os.environ["DISPLAY"]], capture_output=True, text=True, check=True
-    ).stdout.replace("ffff", "")
-
-    subprocess.run(["xauth", "-f", str(tmp_xauth), "nmerge", "-"], input=xauth_cookie, text=True, check=True)
+    # Derive current MIT-MAGIC-COOKIE and make it universally addressable. Two xauth processes
+    # are the minimum here: `nlist` reads the user's authority file while `nmerge` writes the
+    # temporary one, and a single xauth instance only operates on one file. They run
+    # concurrently, with the parent streaming the cookie list between them chunk by chunk and
+    # rewriting the `ffff` family marker on the fly (a short carry handles markers that straddle
+    # a chunk boundary).
+    nlist = subprocess.Popen([XAUTH_BIN, "nlist", os.environ["DISPLAY"]], stdout=subprocess.PIPE)
+    nmerge = subprocess.Popen([XAUTH_BIN, "-f", str(tmp_xauth), "nmerge", "-"], stdin=subprocess.PIPE)
+    carry = b""
+    while chunk := nlist.stdout.read(8192):
+        data = (carry + chunk).replace(b"ffff", b"")
+        carry = data[-3:]
+        nmerge.stdin.write(data[:-3])
+    nmerge.stdin.write(carry)
+    nmerge.stdin.close()
+    for process in (nlist, nmerge):
+        process.wait()
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, process.args)
 
     return tmp_xauth
 
@@ -178,10 +245,13 @@ def x11_refresh(statefile: StateFile):
         print(f"[INFO] X11 Forwarding is {status} from the settings in '.container.cfg'")
 
     # if the file exists, delete it and create a new one
-    if tmp_xauth_value is not None and Path(tmp_xauth_value).exists():
+    tmp_xauth_stat = None
+    if tmp_xauth_value is not None:
+        tmp_xauth_path, tmp_xauth_stat = _stat_or_none(tmp_xauth_value)
+    if tmp_xauth_stat is not None:
         # remove the file and create a new one
-        Path(tmp_xauth_value).unlink()
-        create_x11_tmpfile(tmpfile=Path(tmp_xauth_value))
+        tmp_xauth_path.unlink()
+        create_x11_tmpfile(tmpfile=tmp_xauth_path)
         # update the statefile with the new path
         statefile.set_variable("__ISAACLAB_TMP_XAUTH", str(tmp_xauth_value))
     elif tmp_xauth_value is None: